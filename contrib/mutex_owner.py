@@ -10,6 +10,9 @@ from drgn import FaultError, NULL, Object, cast, container_of, execscript, offse
 from drgn.helpers.common import *
 from drgn.helpers.linux import *
 
+def task_desc(t):
+	return "{}-{}".format(t.comm.string_().decode(), t.pid.value_())
+
 def main(mutex_name):
 	print("Mutex details for '%s'" % mutex_name)
 	print("="*40)
@@ -18,17 +21,17 @@ def main(mutex_name):
 	addr = cast("unsigned long", m.owner.counter) & ~0x7
 	if addr != 0:
 		t = cast("struct task_struct *", addr)
-		owner = "{}-{}".format(t.comm.string_().decode(), int(t.pid))
-		print("\tOwner: {}".format(owner))
+		print("\tOwner: {}".format(task_desc(t)))
 		for e in stack_trace(t):
 			print("\t\t{}".format(e))
 	else:
 		print("\tOwner: none")
 
 	print("\tWaiters:")
+	waiter_type = prog.type('struct mutex_waiter')
 	for waiter in list_for_each(m.wait_list.address_of_()):
-		t = container_of(waiter, prog.type('struct mutex_waiter'), 'list').task
-		print("\t\t{}-{}".format(t.comm.string_().decode(), int(t.pid)))
+		t = container_of(waiter, waiter_type, 'list').task
+		print("\t\t{}".format(task_desc(t)))
 		for e in stack_trace(t):
 			print("\t\t\t{}".format(e))
 
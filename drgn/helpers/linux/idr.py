@@ -14,7 +14,7 @@ import operator
 from typing import Iterator, Tuple, Union
 
 from _drgn import _linux_helper_idr_find
-from drgn import NULL, IntegerLike, Object, Type, cast, sizeof
+from drgn import NULL, IntegerLike, Object, Program, Type, cast
 from drgn.helpers.linux.radixtree import radix_tree_for_each
 
 __all__ = (
@@ -24,7 +24,18 @@ __all__ = (
 )
 
 _IDR_BITS = 8
-_IDR_MASK = (1 << _IDR_BITS) - 1
+
+
+def _idr_is_radix_tree(prog: Program) -> bool:
+    try:
+        return prog.cache["idr_is_radix_tree"]
+    except KeyError:
+        pass
+    # Since Linux kernel commit 0a835c4f090a ("Reimplement IDR and IDA using
+    # the radix tree") (in v4.11), IDRs are backed by radix trees.
+    is_radix_tree = prog.type("struct idr").has_member("idr_rt")
+    prog.cache["idr_is_radix_tree"] = is_radix_tree
+    return is_radix_tree
 
 
 def idr_find(idr: Object, id: IntegerLike) -> Object:
@@ -35,34 +46,12 @@ def idr_find(idr: Object, id: IntegerLike) -> Object:
     :param id: Entry ID.
     :return: ``void *`` found entry, or ``NULL`` if not found.
     """
-    # Since Linux kernel commit 0a835c4f090a ("Reimplement IDR and IDA using
-    # the radix tree") (in v4.11), IDRs are backed by radix trees. Before that,
-    # they are a separate data structure. The helper in libdrgn only handles
-    # the radix tree version.
-    if hasattr(idr, "idr_rt"):
-        return _linux_helper_idr_find(idr, id)
-    else:
-        prog = idr.prog_
-        id = operator.index(id)
-
-        if id < 0:
-            return NULL(prog, "void *")
-
-        p = idr.top.read_()
-        if not p:
-            return NULL(prog, "void *")
-
-        n = (p.layer.value_() + 1) * _IDR_BITS
-        MAX_IDR_SHIFT = sizeof(prog.type("int")) * 8 - 1
-        # Equivalent to id > idr_max(p->layer + 1) in the kernel.
-        if id >= (1 << min(n, MAX_IDR_SHIFT)):
-            return NULL(prog, "void *")
-
-        while n > 0 and p:
-            n -= _IDR_BITS
-            p = p.ary[(id >> n) & _IDR_MASK].read_()
-
-        return cast("void *", p)
+    # The helper in libdrgn handles both radix tree IDRs and the separate data
+    # structure used before Linux kernel commit 0a835c4f090a ("Reimplement IDR
+    # and IDA using the radix tree") (in v4.11). The latter has signed IDs.
+    if not _idr_is_radix_tree(idr.prog_) and operator.index(id) < 0:
+        return NULL(idr.prog_, "void *")
+    return _linux_helper_idr_find(idr, id)
 
 
 def idr_for_each(idr: Object) -> Iterator[Tuple[int, Object]]:
@@ -72,31 +61,31 @@ def idr_for_each(idr: Object) -> Iterator[Tuple[int, Object]]:
     :param idr: ``struct idr *``
     :return: Iterator of (index, ``void *``) tuples.
     """
-    # Since Linux kernel commit 0a835c4f090a ("Reimplement IDR and IDA using
-    # the radix tree") (in v4.11), IDRs are backed by radix trees.
-    try:
-        idr_rt = idr.idr_rt
-    except AttributeError:
+    if not _idr_is_radix_tree(idr.prog_):
         voidp_type = idr.prog_.type("void *")
 
-        def aux(p: Object, id: int, n: int) -> Iterator[Tuple[int, Object]]:
+        # Walk the tree depth-first with an explicit stack rather than
+        # recursive generators. Children are pushed in reverse so that entries
+        # are yielded in ascending order of ID.
+        stack = [(idr.top, 0, idr.layers.value_() * _IDR_BITS)]
+        while stack:
+            p, id, n = stack.pop()
             p = p.read_()
-            if p:
-                if n == 0:
-                    yield id, cast(voidp_type, p)
-                else:
-                    n -= _IDR_BITS
-                    for child in p.ary:
-                        yield from aux(child, id, n)
-                        id += 1 << n
-
-        yield from aux(idr.top, 0, idr.layers.value_() * _IDR_BITS)
+            if not p:
+                continue
+            if n == 0:
+                yield id, cast(voidp_type, p)
+            else:
+                n -= _IDR_BITS
+                ary = p.ary
+                for i in reversed(range(1 << _IDR_BITS)):
+                    stack.append((ary[i], id + (i << n), n))
     else:
         try:
             base = idr.idr_base.value_()
         except AttributeError:
             base = 0
-        for index, entry in radix_tree_for_each(idr_rt.address_of_()):
+        for index, entry in radix_tree_for_each(idr.idr_rt.address_of_()):
             yield index + base, entry
 
 
@@ -598,11 +598,95 @@ null:
 #undef is_node
 }
 
-// Note that this only works since Linux kernel commit 0a835c4f090a
-// ("Reimplement IDR and IDA using the radix tree") (in v4.11). We only need
-// this since Linux kernel commit 95846ecf9dac ("pid: replace pid bitmap
-// implementation with IDR API") (in v4.15) (see find_pid_in_pid_hash()), so
-// that's okay.
+// Before Linux kernel commit 0a835c4f090a ("Reimplement IDR and IDA using the
+// radix tree") (in v4.11), IDRs are a separate tree of struct idr_layer.
+static struct drgn_error *legacy_idr_find(struct drgn_object *res,
+					  const struct drgn_object *idr,
+					  uint64_t id)
+{
+#define IDR_BITS 8
+#define IDR_MASK ((UINT64_C(1) << IDR_BITS) - 1)
+	struct drgn_error *err;
+	struct drgn_program *prog = drgn_object_program(res);
+
+	struct drgn_qualified_type voidp_type;
+	err = drgn_program_find_type(prog, "void *", NULL, &voidp_type);
+	if (err)
+		return err;
+
+	DRGN_OBJECT(p, prog);
+	DRGN_OBJECT(tmp, prog);
+
+	// p = idr->top
+	err = drgn_object_member_dereference(&p, idr, "top");
+	if (err)
+		return err;
+	err = drgn_object_read(&p, &p);
+	if (err)
+		return err;
+	uint64_t p_value;
+	err = drgn_object_read_unsigned(&p, &p_value);
+	if (err)
+		return err;
+	if (!p_value)
+		goto out;
+
+	// n = (p->layer + 1) * IDR_BITS
+	err = drgn_object_member_dereference(&tmp, &p, "layer");
+	if (err)
+		return err;
+	union drgn_value layer;
+	err = drgn_object_read_integer(&tmp, &layer);
+	if (err)
+		return err;
+	uint64_t n = (layer.uvalue + 1) * IDR_BITS;
+
+	// Equivalent to id > idr_max(p->layer + 1) in the kernel.
+	struct drgn_qualified_type int_type;
+	err = drgn_program_find_type(prog, "int", NULL, &int_type);
+	if (err)
+		return err;
+	uint64_t int_size;
+	err = drgn_type_sizeof(int_type.type, &int_size);
+	if (err)
+		return err;
+	if (id >= UINT64_C(1) << min(n, int_size * 8 - 1)) {
+		p_value = 0;
+		goto out;
+	}
+
+	while (n > 0 && p_value) {
+		n -= IDR_BITS;
+		// p = p->ary[(id >> n) & IDR_MASK]
+		err = drgn_object_member_dereference(&tmp, &p, "ary");
+		if (err)
+			return err;
+		uint64_t offset;
+		if (n >= 64) // Avoid undefined behavior.
+			offset = 0;
+		else
+			offset = (id >> n) & IDR_MASK;
+		err = drgn_object_subscript(&p, &tmp, offset);
+		if (err)
+			return err;
+		err = drgn_object_read(&p, &p);
+		if (err)
+			return err;
+		err = drgn_object_read_unsigned(&p, &p_value);
+		if (err)
+			return err;
+	}
+
+out:
+	return drgn_object_set_unsigned(res, voidp_type, p_value, 0);
+
+#undef IDR_MASK
+#undef IDR_BITS
+}
+
+// We only need this since Linux kernel commit 95846ecf9dac ("pid: replace pid
+// bitmap implementation with IDR API") (in v4.15) (see
+// find_pid_in_pid_hash()), but Python callers also use it for older IDRs.
 struct drgn_error *linux_helper_idr_find(struct drgn_object *res,
 					 const struct drgn_object *idr,
 					 uint64_t id)
@@ -627,8 +711,11 @@ struct drgn_error *linux_helper_idr_find(struct drgn_object *res,
 
 	/* radix_tree_lookup(&idr->idr_rt, id) */
 	err = drgn_object_member_dereference(&tmp, idr, "idr_rt");
-	if (err)
-		return err;
+	if (err) {
+		if (!drgn_error_catch(&err, DRGN_ERROR_LOOKUP))
+			return err;
+		return legacy_idr_find(res, idr, id);
+	}
 	err = drgn_object_address_of(&tmp, &tmp);
 	if (err)
 		return err;
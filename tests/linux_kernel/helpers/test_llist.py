@@ -21,18 +21,14 @@ class TestLlist(LinuxKernelTestCase):
         super().setUpClass()
         cls.empty = cls.prog["drgn_test_empty_llist"].address_of_()
         cls.full = cls.prog["drgn_test_full_llist"].address_of_()
-        cls.entries = cls.prog["drgn_test_llist_entries"]
+        entries = cls.prog["drgn_test_llist_entries"]
         cls.num_entries = 3
+        cls.entries = [entries[i].address_of_() for i in range(cls.num_entries)]
+        cls.nodes = [entry.node.address_of_() for entry in cls.entries]
         cls.singular = cls.prog["drgn_test_singular_llist"].address_of_()
         cls.singular_entry = cls.prog["drgn_test_singular_llist_entry"].address_of_()
         cls.singular_node = cls.singular_entry.node.address_of_()
 
-    def node(self, n):
-        return self.entries[n].node.address_of_()
-
-    def entry(self, n):
-        return self.entries[n].address_of_()
-
     def test_llist_empty(self):
         self.assertTrue(llist_empty(self.empty))
         self.assertFalse(llist_empty(self.full))
@@ -46,7 +42,7 @@ class TestLlist(LinuxKernelTestCase):
     def test_llist_first_entry(self):
         self.assertEqual(
             llist_first_entry(self.full, "struct drgn_test_llist_entry", "node"),
-            self.entry(2),
+            self.entries[2],
         )
         self.assertEqual(
             llist_first_entry(self.singular, "struct drgn_test_llist_entry", "node"),
@@ -64,7 +60,7 @@ class TestLlist(LinuxKernelTestCase):
             llist_first_entry_or_null(
                 self.full, "struct drgn_test_llist_entry", "node"
             ),
-            self.entry(2),
+            self.entries[2],
         )
         self.assertEqual(
             llist_first_entry_or_null(
@@ -75,13 +71,15 @@ class TestLlist(LinuxKernelTestCase):
 
     def test_llist_next_entry(self):
         for i in reversed(range(1, self.num_entries)):
-            self.assertEqual(llist_next_entry(self.entry(i), "node"), self.entry(i - 1))
+            self.assertEqual(
+                llist_next_entry(self.entries[i], "node"), self.entries[i - 1]
+            )
 
     def test_llist_for_each(self):
         self.assertEqual(list(llist_for_each(self.empty.first)), [])
         self.assertEqual(
             list(llist_for_each(self.full.first)),
-            [self.node(i) for i in reversed(range(self.num_entries))],
+            self.nodes[::-1],
         )
         self.assertEqual(
             list(llist_for_each(self.singular.first)), [self.singular_node]
@@ -102,7 +100,7 @@ class TestLlist(LinuxKernelTestCase):
                     "struct drgn_test_llist_entry", self.full.first, "node"
                 )
             ),
-            [self.entry(i) for i in reversed(range(self.num_entries))],
+            self.entries[::-1],
         )
         self.assertEqual(
             list(